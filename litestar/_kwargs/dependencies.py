@@ -3,7 +3,6 @@ from __future__ import annotations
 from inspect import isasyncgen, isgenerator
 from typing import TYPE_CHECKING, Any
 
-from litestar._signature.utils import get_signature_model
 from litestar.utils.compat import async_next
 
 __all__ = ("Dependency", "create_dependency_batches", "map_dependencies_recursively", "resolve_dependency")
@@ -58,7 +57,8 @@ async def resolve_dependency(
         kwargs: Any kwargs to pass to the dependency, the result will be stored here as well.
         cleanup_group: DependencyCleanupGroup to which generators returned by ``dependency`` will be added
     """
-    signature_model = get_signature_model(dependency.provide)
+    # validated in KwargsModel._create_dependency_graph
+    signature_model = dependency.provide.signature_model
     dependency_kwargs = (
         signature_model.parse_values_from_connection_kwargs(connection=connection, **kwargs)
         if signature_model.fields
@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, cast
 
 from litestar._multipart import parse_multipart_form
-from litestar._parsers import (
-    parse_headers,
-    parse_query_string,
-    parse_url_encoded_form_data,
-)
+from litestar._parsers import parse_query_string, parse_url_encoded_form_data
 from litestar.datastructures.upload_file import UploadFile
 from litestar.dto.interface import ConnectionContext
 from litestar.enums import ParamType, RequestEncodingType
@@ -63,26 +59,28 @@ def create_connection_value_extractor(
         An extractor function.
     """
 
-    alias_and_key_tuple = tuple(
-        (p.field_alias.lower() if p.param_type == ParamType.HEADER else p.field_alias, p.field_name)
+    # ``Empty`` marks parameters that are required
+    alias_key_and_default_tuple = tuple(
+        (
+            p.field_alias.lower() if p.param_type == ParamType.HEADER else p.field_alias,
+            p.field_name,
+            Empty if p.is_required or p.default is Ellipsis else p.default,
+        )
         for p in expected_params
     )
-    alias_defaults = {
-        p.field_alias.lower() if p.param_type == ParamType.HEADER else p.field_alias: p.default
-        for p in expected_params
-        if not (p.is_required or p.default is Ellipsis)
-    }
+
+    get_connection_value = attrgetter(connection_key)
 
     def extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
-        data = parser(connection, kwargs_model) if parser else getattr(connection, connection_key, {})
+        data = parser(connection, kwargs_model) if parser else get_connection_value(connection)
 
-        try:
-            connection_mapping: dict[str, Any] = {
-                key: data[alias] if alias in data else alias_defaults[alias] for alias, key in alias_and_key_tuple
-            }
-            values.update(connection_mapping)
-        except KeyError as e:
-            raise ValidationException(f"Missing required parameter {e.args[0]} for url {connection.url}") from e
+        for alias, key, default in alias_key_and_default_tuple:
+            try:
+                values[key] = data[alias]
+            except KeyError as e:
+                if default is Empty:
+                    raise ValidationException(f"Missing required parameter {alias} for url {connection.url}") from e
+                values[key] = default
 
     return extractor
 
@@ -90,29 +88,35 @@ def create_connection_value_extractor(
 @lru_cache(1024)
 def create_query_default_dict(
     parsed_query: tuple[tuple[str, str], ...], sequence_query_parameter_names: tuple[str, ...]
-) -> defaultdict[str, list[str] | str]:
-    """Transform a list of tuples into a default dict. Ensures non-list values are not wrapped in a list.
+) -> dict[str, list[str] | str]:
+    """Transform a list of tuples into a dict. Ensures non-list values are not wrapped in a list.
+
+    Notes:
+        - The result is cached and shared between requests, hence a plain dict is used - a ``defaultdict`` would insert
+            a new key into the shared instance on every lookup of a missing key.
 
     Args:
         parsed_query: The parsed query list of tuples.
         sequence_query_parameter_names: A set of query parameters that should be wrapped in list.
 
     Returns:
-        A default dict
+        A dict
     """
-    output: defaultdict[str, list[str] | str] = defaultdict(list)
+    output: dict[str, Any] = {}
 
     for k, v in parsed_query:
-        if k in sequence_query_parameter_names:
-            output[k].append(v)  # type: ignore
-        else:
+        if k not in sequence_query_parameter_names:
             output[k] = v
+        elif k in output:
+            output[k].append(v)
+        else:
+            output[k] = [v]
 
     return output
 
 
 def parse_connection_query_params(connection: ASGIConnection, kwargs_model: KwargsModel) -> dict[str, Any]:
-    """Parse query params and cache the result in scope.
+    """Parse query params and cache the result on the connection and in scope.
 
     Args:
         connection: The ASGI connection instance.
@@ -121,18 +125,18 @@ def parse_connection_query_params(connection: ASGIConnection, kwargs_model: Kwar
     Returns:
         A dictionary of parsed values.
     """
-    parsed_query = connection.scope["_parsed_query"] = (  # type: ignore
-        connection._parsed_query
-        if connection._parsed_query is not Empty
-        else parse_query_string(connection.scope.get("query_string", b""))
-    )
+    if connection._parsed_query is Empty:
+        connection._parsed_query = connection.scope["_parsed_query"] = parse_query_string(  # type: ignore
+            connection.scope.get("query_string", b"")
+        )
     return create_query_default_dict(
-        parsed_query=parsed_query, sequence_query_parameter_names=kwargs_model.sequence_query_parameter_names
+        parsed_query=connection._parsed_query,
+        sequence_query_parameter_names=kwargs_model.sequence_query_parameter_names,
     )
 
 
 def parse_connection_headers(connection: ASGIConnection, _: KwargsModel) -> dict[str, Any]:
-    """Parse header parameters and cache the result in scope.
+    """Parse header parameters and cache the result on the connection and in scope.
 
     Args:
         connection: The ASGI connection instance.
@@ -141,10 +145,7 @@ def parse_connection_headers(connection: ASGIConnection, _: KwargsModel) -> dict
     Returns:
         A dictionary of parsed values
     """
-    parsed_headers = connection.scope["_headers"] = (  # type: ignore
-        connection._headers if connection._headers is not Empty else parse_headers(tuple(connection.scope["headers"]))
-    )
-    return cast("dict[str, Any]", parsed_headers)
+    return connection._get_parsed_headers()
 
 
 def state_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
@@ -304,6 +305,9 @@ def create_multipart_extractor(
     if field_definition.kwarg_definition and isinstance(field_definition.kwarg_definition, BodyKwarg):
         body_kwarg_multipart_form_part_limit = field_definition.kwarg_definition.multipart_form_part_limit
 
+    is_sequence = field_definition.is_non_string_sequence
+    is_upload_file = field_definition.is_simple_type and field_definition.annotation is UploadFile
+
     async def extract_multipart(
         connection: Request[Any, Any, Any],
     ) -> Any:
@@ -322,10 +326,22 @@ def create_multipart_extractor(
             )
         )
 
-        if field_definition.is_non_string_sequence:
-            return list(form_values.values())
-        if field_definition.is_simple_type and field_definition.annotation is UploadFile and form_values:
-            return next(v for v in form_values.values() if isinstance(v, UploadFile))
+        if is_sequence or (is_upload_file and form_values):
+            values: list[Any] = []
+            for value in form_values.values():
+                # files sent under a repeated key are grouped into a list, JSON arrays never contain files
+                if isinstance(value, list) and any(isinstance(v, UploadFile) for v in value):
+                    values.extend(value)
+                else:
+                    values.append(value)
+
+            if is_sequence:
+                return values
+
+            for value in values:
+                if isinstance(value, UploadFile):
+                    return value
+            raise ValidationException(f"Missing required file in multipart form data for url {connection.url}")
 
         if not form_values and is_data_optional:
             return None
@@ -45,6 +45,18 @@ if TYPE_CHECKING:
     from litestar.dto.interface import DTOInterface
     from litestar.utils.signature import ParsedSignature
 
+# the extractor for ``data`` is not included because it depends on the handler's expected request body
+RESERVED_KWARGS_EXTRACTORS: dict[str, Callable[[dict[str, Any], ASGIConnection], None]] = {
+    "state": state_extractor,
+    "scope": scope_extractor,
+    "request": request_extractor,
+    "socket": socket_extractor,
+    "headers": headers_extractor,
+    "cookies": cookies_extractor,
+    "query": query_extractor,
+    "body": body_extractor,  # type: ignore
+}
+
 
 class KwargsModel:
     """Model required kwargs for a given RouteHandler and its dependencies.
@@ -125,20 +137,9 @@ class KwargsModel:
         self.dependency_batches = create_dependency_batches(expected_dependencies)
 
     def _create_extractors(self) -> list[Callable[[dict[str, Any], ASGIConnection], None]]:
-        reserved_kwargs_extractors: dict[str, Callable[[dict[str, Any], ASGIConnection], None]] = {
-            "data": create_data_extractor(self),
-            "state": state_extractor,
-            "scope": scope_extractor,
-            "request": request_extractor,
-            "socket": socket_extractor,
-            "headers": headers_extractor,
-            "cookies": cookies_extractor,
-            "query": query_extractor,
-            "body": body_extractor,  # type: ignore
-        }
-
         extractors: list[Callable[[dict[str, Any], ASGIConnection], None]] = [
-            reserved_kwargs_extractors[reserved_kwarg] for reserved_kwarg in self.expected_reserved_kwargs
+            create_data_extractor(self) if reserved_kwarg == "data" else RESERVED_KWARGS_EXTRACTORS[reserved_kwarg]
+            for reserved_kwarg in self.expected_reserved_kwargs
         ]
 
         if self.expected_header_params:
@@ -41,6 +41,8 @@ _token = r"([\w!#$%&'*+\-.^_`|~]+)"  # noqa: S105
 _quoted = r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
 _firefox_quote_escape = re.compile(r'\\"(?!; |\s*$)')
+# matches the first character any JSON document can start with, used to skip decoding values that cannot be JSON
+_json_start = re.compile(rb'\s*[\[{"tfn0-9-]')
 
 
 def parse_content_header(value: str) -> tuple[str, dict[str, str]]:
@@ -146,10 +148,12 @@ def parse_multipart_form(body: bytes, boundary: bytes, multipart_form_part_limit
                     content_type=content_type, filename=file_name, file_data=post_data, headers=dict(headers)
                 )
                 fields[field_name].append(form_file)
-            else:
+            elif _json_start.match(post_data):
                 try:
                     fields[field_name].append(decode_json(post_data))
                 except SerializationException:
                     fields[field_name].append(post_data.decode(content_charset))
+            else:
+                fields[field_name].append(post_data.decode(content_charset))
 
     return {k: v if len(v) > 1 else v[0] for k, v in fields.items()}
@@ -47,14 +47,24 @@ def parse_cookie_string(cookie_string: str) -> dict[str, str]:
     Returns:
         A string keyed dictionary of values
     """
-    cookies = [cookie.split("=", 1) if "=" in cookie else ("", cookie) for cookie in cookie_string.split(";")]
-    output: dict[str, str] = {
-        k: unquote(unquote_cookie(v))
-        for k, v in filter(
-            lambda x: x[0] or x[1],
-            ((k.strip(), v.strip()) for k, v in cookies),
-        )
-    }
+    output: dict[str, str] = {}
+
+    for cookie in cookie_string.split(";"):
+        key, sep, value = cookie.partition("=")
+        if not sep:
+            key, value = "", key
+
+        key, value = key.strip(), value.strip()
+        if not (key or value):
+            continue
+
+        if value[:1] == '"':
+            value = unquote_cookie(value)
+        if "%" in value:
+            value = unquote(value)
+
+        output[key] = value
+
     return output
 
 
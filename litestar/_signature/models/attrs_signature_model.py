@@ -51,6 +51,8 @@ __all__ = ("AttrsSignatureModel",)
 key_re = re.compile("@ (attribute|index) (.*)|'(.*)'")
 TRUE_SET = {"1", "true", "on", "t", "y", "yes"}
 FALSE_SET = {"0", "false", "off", "f", "n", "no"}
+# a single lookup table for bool coercion - the numeric keys also match ``True``, ``False``, ``0.0``, ``1.0`` etc.
+BOOL_VALUES: dict[Any, bool] = {0: False, 1: True, **dict.fromkeys(FALSE_SET, False), **dict.fromkeys(TRUE_SET, True)}
 
 try:
     import pydantic
@@ -80,18 +82,15 @@ def _pass_through_unstructure_hook(value: Any) -> Any:
 
 def _structure_bool(value: Any, _: type[bool]) -> bool:
     if isinstance(value, bytes):
-        value = value.decode("utf-8").lower()
+        value = value.decode("utf-8")
 
     if isinstance(value, str):
         value = value.lower()
 
-    if value == 0 or value in FALSE_SET:
-        return False
+    if (result := BOOL_VALUES.get(value)) is None:
+        raise ValueError(f"Cannot convert {value} to bool")
 
-    if value == 1 or value in TRUE_SET:
-        return True
-
-    raise ValueError(f"Cannot convert {value} to bool")
+    return result
 
 
 def _structure_datetime(value: Any, cls: type[datetime]) -> datetime:
@@ -56,7 +56,7 @@ class PydanticSignatureModel(SignatureModel, BaseModel):
 
         Returns: A dictionary of string keyed values.
         """
-        return {key: self.__getattribute__(key) for key in self.__fields__}
+        return {key: self.__dict__[key] for key in self.__fields__}
 
     @classmethod
     def field_definition_from_model_field(cls, model_field: ModelField) -> FieldDefinition:
@@ -57,7 +57,7 @@ async def empty_send(_: Message) -> NoReturn:  # pragma: no cover
 class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
     """The base ASGI connection container."""
 
-    __slots__ = ("scope", "receive", "send", "_base_url", "_url", "_parsed_query", "_headers", "_cookies")
+    __slots__ = ("scope", "receive", "send", "_base_url", "_url", "_parsed_query", "_headers", "_cookies", "_state")
 
     scope: Scope
     """The ASGI scope attached to the connection."""
@@ -82,6 +82,7 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         self._parsed_query: Any = scope.get("_parsed_query", Empty)
         self._cookies: Any = scope.get("_cookies", Empty)
         self._headers: Any = scope.get("_headers", Empty)
+        self._state: Any = Empty
 
     @property
     def app(self) -> Litestar:
@@ -108,7 +109,10 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         Returns:
             A State instance constructed from the scope["state"] value.
         """
-        return cast("StateT", State(self.scope["state"]))
+        if self._state is Empty:
+            self._state = State(self.scope["state"])
+
+        return cast("StateT", self._state)
 
     @property
     def url(self) -> URL:
@@ -148,11 +152,19 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         Returns:
             A Headers instance with the request's scope["headers"] value.
         """
+        return Headers(self._get_parsed_headers())
+
+    def _get_parsed_headers(self) -> dict[str, str]:
+        """Parse and cache the headers of this connection's ``Scope``.
+
+        Returns:
+            A string keyed dictionary of header values.
+        """
         if self._headers is Empty:
             self.scope.setdefault("headers", [])
             self._headers = self.scope["_headers"] = parse_headers(tuple(self.scope["headers"]))  # type: ignore[typeddict-unknown-key]
 
-        return Headers(self._headers)
+        return cast("dict[str, str]", self._headers)
 
     @property
     def query_params(self) -> MultiDict[Any]:
@@ -211,10 +223,12 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         Returns:
             A type correlating to the generic variable Auth.
         """
-        if "auth" not in self.scope:
-            raise ImproperlyConfiguredException("'auth' is not defined in scope, install an AuthMiddleware to set it")
-
-        return cast("AuthT", self.scope["auth"])
+        try:
+            return cast("AuthT", self.scope["auth"])
+        except KeyError as e:
+            raise ImproperlyConfiguredException(
+                "'auth' is not defined in scope, install an AuthMiddleware to set it"
+            ) from e
 
     @property
     def user(self) -> UserT:
@@ -226,10 +240,12 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         Returns:
             A type correlating to the generic variable User.
         """
-        if "user" not in self.scope:
-            raise ImproperlyConfiguredException("'user' is not defined in scope, install an AuthMiddleware to set it")
-
-        return cast("UserT", self.scope["user"])
+        try:
+            return cast("UserT", self.scope["user"])
+        except KeyError as e:
+            raise ImproperlyConfiguredException(
+                "'user' is not defined in scope, install an AuthMiddleware to set it"
+            ) from e
 
     @property
     def session(self) -> dict[str, Any]:
@@ -241,12 +257,12 @@ class ASGIConnection(Generic[HandlerT, UserT, AuthT, StateT]):
         Raises:
             ImproperlyConfiguredException: if session is not set in scope.
         """
-        if "session" not in self.scope:
+        try:
+            return cast("dict[str, Any]", self.scope["session"])
+        except KeyError as e:
             raise ImproperlyConfiguredException(
                 "'session' is not defined in scope, install a SessionMiddleware to set it"
-            )
-
-        return cast("dict[str, Any]", self.scope["session"])
+            ) from e
 
     @property
     def logger(self) -> Logger:
@@ -104,7 +104,7 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
         """
         if self._json is Empty:
             body = await self.body()
-            self._json = self.scope["_json"] = decode_json(body or b"null")  # type: ignore[typeddict-unknown-key]
+            self._json = self.scope["_json"] = decode_json(body) if body else None  # type: ignore[typeddict-unknown-key]
         return self._json
 
     async def msgpack(self) -> Any:
@@ -115,7 +115,7 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
         """
         if self._msgpack is Empty:
             body = await self.body()
-            self._msgpack = self.scope["_msgpack"] = decode_msgpack(body or b"\xc0")  # type: ignore[typeddict-unknown-key]
+            self._msgpack = self.scope["_msgpack"] = decode_msgpack(body) if body else None  # type: ignore[typeddict-unknown-key]
         return self._msgpack
 
     async def stream(self) -> AsyncGenerator[bytes, None]:
@@ -156,7 +156,8 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
             A byte-string representing the body of the request.
         """
         if self._body is Empty:
-            self._body = self.scope["_body"] = b"".join([c async for c in self.stream()])  # type: ignore[typeddict-unknown-key]
+            # skip empty chunks, so a single chunk body is not copied by ``join``
+            self._body = self.scope["_body"] = b"".join([c async for c in self.stream() if c])  # type: ignore[typeddict-unknown-key]
         return cast("bytes", self._body)
 
     async def form(self) -> FormMultiDict:
@@ -66,6 +66,7 @@ class ConnectionDataExtractor:
     __slots__ = (
         "connection_extractors",
         "request_extractors",
+        "http_request_extractors",
         "parse_body",
         "parse_query",
         "obfuscate_headers",
@@ -133,6 +134,10 @@ class ConnectionDataExtractor:
             self.request_extractors["content_type"] = self.extract_content_type
         if extract_body:
             self.request_extractors["body"] = self.extract_body
+        self.http_request_extractors: dict[str, Callable[[ASGIConnection[Any, Any, Any, Any]], Any]] = {
+            **self.connection_extractors,
+            **self.request_extractors,  # type: ignore
+        }
 
     def __call__(self, connection: ASGIConnection[Any, Any, Any, Any]) -> ExtractedRequestData:
         """Extract data from the connection, returning a dictionary of values.
@@ -146,11 +151,7 @@ class ConnectionDataExtractor:
         Returns:
             A string keyed dictionary of extracted values.
         """
-        extractors = (
-            {**self.connection_extractors, **self.request_extractors}  # type: ignore
-            if isinstance(connection, Request)
-            else self.connection_extractors
-        )
+        extractors = self.http_request_extractors if isinstance(connection, Request) else self.connection_extractors
         return cast("ExtractedRequestData", {key: extractor(connection) for key, extractor in extractors.items()})
 
     @staticmethod
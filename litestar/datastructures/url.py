@@ -190,7 +190,7 @@ class URL:
 
         return cls.from_components(
             scheme=scheme if server else "",
-            query=query_string.decode(),
+            query=query_string.decode() if query_string else "",
             netloc=host,
             path=path,
         )
@@ -83,7 +83,7 @@ class HTTPRoute(BaseRoute):
         if after_response_handler := route_handler.resolve_after_response():
             await after_response_handler(request)
 
-        if form_data := scope.get("_form", {}):
+        if form_data := scope.get("_form"):
             await self._cleanup_temporary_files(form_data=cast("dict[str, Any]", form_data))
 
     def create_handler_map(self) -> None:
@@ -193,6 +193,18 @@ def test_request_accept_header() -> None:
     assert response.json() == {"accepted_types": ["text/html;p=test", "text/plain", "application/xml;q=0.7"]}
 
 
+def test_request_mixed_case_headers() -> None:
+    request = Request[Any, Any, Any](
+        {
+            "type": "http",
+            "headers": [(b"Content-Type", b"application/json"), (b"Accept", b"text/html"), (b"Cookie", b"a=1")],
+        }
+    )
+    assert request.content_type == ("application/json", {})
+    assert list(request.accept) == ["text/html"]
+    assert request.cookies == {"a": "1"}
+
+
 @pytest.mark.parametrize(
     "scope,expected_client",
     (
@@ -409,6 +409,51 @@ def test_optional_formdata() -> None:
         assert response.status_code == HTTP_201_CREATED
 
 
+def test_multipart_repeated_keys_are_flattened_into_list() -> None:
+    @post("/")
+    async def hello_world(data: List[UploadFile] = Body(media_type=RequestEncodingType.MULTI_PART)) -> List[str]:
+        return [file.filename for file in data]
+
+    with create_test_client(route_handlers=[hello_world]) as client:
+        response = client.post(
+            "/", files=[("files", ("a.txt", b"a")), ("files", ("b.txt", b"b")), ("other", ("c.txt", b"c"))]
+        )
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_multipart_repeated_keys_single_upload_file() -> None:
+    @post("/")
+    async def hello_world(data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART)) -> str:
+        return data.filename
+
+    with create_test_client(route_handlers=[hello_world]) as client:
+        response = client.post("/", files=[("file", ("a.txt", b"a")), ("file", ("b.txt", b"b"))])
+        assert response.status_code == HTTP_201_CREATED
+        assert response.text == "a.txt"
+
+
+def test_multipart_json_array_value_is_not_flattened() -> None:
+    @post("/")
+    async def hello_world(data: List[Any] = Body(media_type=RequestEncodingType.MULTI_PART)) -> List[Any]:
+        return data
+
+    with create_test_client(route_handlers=[hello_world]) as client:
+        response = client.post("/", files={"a": (None, b"[1, 2]"), "b": (None, b"x")})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == [[1, 2], "x"]
+
+
+def test_multipart_upload_file_missing_from_form() -> None:
+    @post("/")
+    async def hello_world(data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
+        pass
+
+    with create_test_client(route_handlers=[hello_world]) as client:
+        response = client.post("/", files={"a": (None, b"x")})
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.parametrize("limit", (1000, 100, 10))
 def test_multipart_form_part_limit(limit: int) -> None:
     @post("/")
@@ -12,6 +12,7 @@ from urllib.parse import urlencode
 import pytest
 
 from litestar import MediaType, Request, get
+from litestar._kwargs.extractors import create_query_default_dict
 from litestar.datastructures import MultiDict
 from litestar.di import Provide
 from litestar.params import Parameter
@@ -221,3 +222,14 @@ def test_query_param_dependency_with_alias() -> None:
         response = client.get("/?pageSize=1")
         assert response.status_code == HTTP_200_OK, response.text
         assert response.text == "1"
+
+
+def test_create_query_default_dict() -> None:
+    parsed_query = (("a", "1"), ("b", "2"), ("b", "3"), ("c", "4"))
+    result = create_query_default_dict(parsed_query=parsed_query, sequence_query_parameter_names=("b", "c"))
+    assert result == {"a": "1", "b": ["2", "3"], "c": ["4"]}
+
+    # the result is cached, so looking up a missing key must not add it
+    with pytest.raises(KeyError):
+        result["d"]
+    assert create_query_default_dict(parsed_query=parsed_query, sequence_query_parameter_names=("b", "c")) is result